@@ -24,7 +24,7 @@ class _DeepGPVariationalStrategy(object):
         return self._sub_variational_strategies_memo
 
     def kl_divergence(self):
-        return sum(strategy.kl_divergence().sum() for strategy in self.sub_variational_strategies)
+        return torch.stack([strategy.kl_divergence().sum() for strategy in self.sub_variational_strategies]).sum()
 
 
 class DeepGPLayer(ApproximateGP):
@@ -81,7 +81,7 @@ class DeepGPLayer(ApproximateGP):
             if not torch.is_tensor(inputs):
                 raise ValueError(
                     "`inputs` should either be a MultitaskMultivariateNormal or a Tensor, got "
-                    f"{inputs.__class__.__Name__}"
+                    f"{inputs.__class__.__name__}"
                 )
 
             if inputs.size(-1) != self.input_dims:
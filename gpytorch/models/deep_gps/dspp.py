@@ -22,6 +22,9 @@ class DSPPLayer(DeepGPLayer):
         output dimensionality. If set to `None`, then the output dimension will be squashed.
     :param int num_quad_sites: Number of quadrature sites to use. Also the number of Gaussians in the mixture output
         by this layer.
+    :param torch.nn.Parameter quad_sites: (default None) A `num_quad_sites x input_dims` parameter of quadrature
+        sites. Pass in `previous_layer.quad_sites` to share one set of sites across layers with the same
+        `input_dims`. If set to `None`, the layer creates and learns its own sites.
 
     Again, refer to the documentation for DeepGPLayer or our example notebooks for full details on what calling a
     DSPPLayer module does. The high level overview is that if a tensor `x` is `n x d` then
@@ -48,9 +51,17 @@ class DSPPLayer(DeepGPLayer):
             # This is for subsequent layers. We apply quadrature here
             # Mean, stdv are q x ... x n x t
             mus, sigmas = inputs.mean, inputs.variance.sqrt()
-            qg = self.quad_sites.view([self.num_quad_sites] + [1] * (mus.dim() - 2) + [self.input_dims])
-            sigmas = sigmas * qg
-            inputs = mus + sigmas  # q^t x n x t
+            if settings.debug.on():
+                expected_shape = torch.Size([self.num_quad_sites, self.input_dims])
+                if self.quad_sites.shape != expected_shape:
+                    raise RuntimeError(
+                        "quad_sites shape did not match (num_quad_sites, input_dims). Got "
+                        f"{list(self.quad_sites.shape)}, expected {list(expected_shape)}"
+                    )
+            # Match the dtype of sigmas so that autocast does not promote the expansion to full precision
+            qg = self.quad_sites.to(sigmas.dtype)
+            qg = qg.view([self.num_quad_sites] + [1] * (mus.dim() - 2) + [self.input_dims])
+            inputs = torch.addcmul(mus, sigmas, qg)  # q^t x n x t
             deterministic_inputs = False
         else:
             deterministic_inputs = True
@@ -59,7 +70,7 @@ class DSPPLayer(DeepGPLayer):
             if not torch.is_tensor(inputs):
                 raise ValueError(
                     "`inputs` should either be a MultitaskMultivariateNormal or a Tensor, got "
-                    f"{inputs.__class__.__Name__}"
+                    f"{inputs.__class__.__name__}"
                 )
 
             if inputs.size(-1) != self.input_dims:
@@ -81,13 +92,12 @@ class DSPPLayer(DeepGPLayer):
         if deterministic_inputs:
             output = output.expand(torch.Size([self.num_quad_sites]) + output.batch_shape)
 
-        if self.num_quad_sites > 0:
-            if self.output_dims is not None and not isinstance(output, MultitaskMultivariateNormal):
-                mean = output.loc.transpose(-1, -2)
-                covar = BlockDiagLazyTensor(output.lazy_covariance_matrix, block_dim=-3)
-                output = MultitaskMultivariateNormal(mean, covar, interleaved=False)
-        else:
+        if self.num_quad_sites <= 0:
             output = output.loc.transpose(-1, -2)  # this layer provides noiseless kernel interpolation
+        elif self.output_dims is not None and not isinstance(output, MultitaskMultivariateNormal):
+            mean = output.loc.transpose(-1, -2)
+            covar = BlockDiagLazyTensor(output.lazy_covariance_matrix, block_dim=-3)
+            output = MultitaskMultivariateNormal(mean, covar, interleaved=False)
 
         return output
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import math
+from functools import lru_cache
 
 import numpy as np
 import torch
@@ -10,6 +11,12 @@ from .. import settings
 from .broadcasting import _pad_with_singletons
 
 
+@lru_cache(maxsize=64)
+def _hermgauss(num_locs, dtype):
+    locations, weights = np.polynomial.hermite.hermgauss(num_locs)
+    return torch.from_numpy(locations).to(dtype), torch.from_numpy(weights).to(dtype)
+
+
 class GaussHermiteQuadrature1D(Module):
     """
     Implements Gauss-Hermite quadrature for integrating a function with respect to several 1D Gaussian distributions
@@ -43,10 +50,9 @@ class GaussHermiteQuadrature1D(Module):
 
         Instead, create a GaussHermiteQuadrature1D object and get the locations and weights from buffers.
         """
-        locations, weights = np.polynomial.hermite.hermgauss(num_locs)
-        locations = torch.Tensor(locations)
-        weights = torch.Tensor(weights)
-        return locations, weights
+        locations, weights = _hermgauss(num_locs, torch.get_default_dtype())
+        # The cached tensors are shared, so hand out copies
+        return locations.clone(), weights.clone()
 
     def forward(self, func, gaussian_dists):
         """
@@ -138,6 +138,15 @@ class TestQuadrature(unittest.TestCase):
             with least_used_cuda_device():
                 self.test_gauss_hermite_quadrature_1D_normal_nonbatch(cuda=True)
 
+    def test_gauss_hermite_quadrature_1D_locations_not_shared(self):
+        quadrature1 = GaussHermiteQuadrature1D(num_locs=10)
+        quadrature2 = GaussHermiteQuadrature1D(num_locs=10)
+        self.assertTrue(torch.equal(quadrature1.locations, quadrature2.locations))
+        self.assertTrue(torch.equal(quadrature1.weights, quadrature2.weights))
+
+        quadrature1.locations.mul_(2.0)
+        self.assertFalse(torch.equal(quadrature1.locations, quadrature2.locations))
+
 
 if __name__ == "__main__":
     unittest.main()